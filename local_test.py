@@ -1,21 +1,63 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, SessionNotCreatedException
+import os
 import requests
-from googletrans import Translator
+from requests.adapters import HTTPAdapter
+import shutil
+from lxml import html
 import re
 from collections import Counter
+import translation_cache
+
+# Shared HTTP session so the image downloads reuse one TCP/TLS connection.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Where we remember the chromedriver path between runs.
+DRIVER_PATH_CACHE = ".chromedriver_path"
+
+
+def get_chromedriver_path(refresh=False):
+    # `ChromeDriverManager().install()` is a network call, so only run it
+    # (and import webdriver_manager at all) when we have no cached driver,
+    # or when `refresh` asks for a fresh one.
+    if refresh and os.path.isfile(DRIVER_PATH_CACHE):
+        os.remove(DRIVER_PATH_CACHE)
+    if os.path.isfile(DRIVER_PATH_CACHE):
+        with open(DRIVER_PATH_CACHE) as f:
+            path = f.read().strip()
+        if os.path.isfile(path):
+            return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    with open(DRIVER_PATH_CACHE, 'w') as f:
+        f.write(path)
+    return path
+
 
 # === START OF STEP 1 CODE ===
 print("Starting the script...")
-driver_service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=driver_service)
+try:
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()))
+except SessionNotCreatedException:
+    # The cached driver no longer matches Chrome (e.g. after an auto-update),
+    # so fetch a matching one and try again.
+    print("Cached chromedriver is out of date, downloading a new one...")
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path(refresh=True)))
+# Wait only as long as the page actually needs, checking every 100 ms.
+wait = WebDriverWait(driver, 10, poll_frequency=0.1)
 opinion_url = "https://elpais.com/opinion/"
 driver.get(opinion_url)
 print(f"Opened {opinion_url}")
-time.sleep(3)
+try:
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h2 a")))
+except TimeoutException:
+    print("WARN: Timed out waiting for the article links to load.")
 # === END OF STEP 1 CODE ===
 
 
@@ -37,42 +79,47 @@ all_spanish_content = []
 for i, url in enumerate(article_urls):
     print(f"\n--- Scraping Article {i+1}: {url} ---")
     driver.get(url)
-    time.sleep(2)
+    try:
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+    except TimeoutException:
+        print("WARN: Timed out waiting for the article to load.")
+
+    # Read the page once and parse it locally, instead of asking
+    # chromedriver for each element separately.
+    tree = html.fromstring(driver.page_source)
+    tree.make_links_absolute(driver.current_url)
 
     # --- 3A. GET TITLE (Spanish) ---
-    try:
-        title = driver.find_element(By.TAG_NAME, "h1").text
+    headings = tree.xpath('//h1')
+    title = headings[0].text_content().strip() if headings else None
+    if title:
         print(f"TITLE (ES): {title}")
         spanish_titles.append(title)
-    except Exception as e:
-        print(f"Could not find title: {e}")
-        spanish_titles.append(None)
+    else:
+        print("Could not find title.")
 
     # --- 3B. GET CONTENT (Spanish) ---
-    try:
-        content_body = driver.find_element(
-            By.CSS_SELECTOR, "div.c-article-body")
-        paragraphs = content_body.find_elements(By.TAG_NAME, "p")
-        full_content = "\n".join([p.text for p in paragraphs])
+    paragraphs = tree.xpath('//div[contains(@class,"c-article-body")]//p')
+    if paragraphs:
+        full_content = "\n".join([p.text_content() for p in paragraphs])
         all_spanish_content.append(full_content)
         print(f"CONTENT (ES) Snippet:\n{full_content[:200]}...")
-    except Exception as e:
-        print(f"Could not find content: {e}")
+    else:
+        print("Could not find content.")
 
     # --- 3C. DOWNLOAD IMAGE ---
     try:
-        image_element = driver.find_element(By.CSS_SELECTOR, "figure img")
-        image_url = image_element.get_attribute('src')
+        image_urls = tree.xpath('//figure//img/@src')
+        image_url = image_urls[0] if image_urls else None
         if image_url:
-            response = requests.get(image_url)
-            if response.status_code == 200:
+            # Stream the image straight to disk instead of holding it in memory.
+            with SESSION.get(image_url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
                 filename = f"article_image_{i+1}.jpg"
                 with open(filename, 'wb') as f:
-                    f.write(response.content)
+                    shutil.copyfileobj(response.raw, f, length=8192)
                 print(f"SUCCESS: Saved image to {filename}")
-            else:
-                print(
-                    f"WARN: Could not download image, status: {response.status_code}")
     except Exception as e:
         print(f"WARN: Could not find or save image: {e}")
 # === END OF STEP 3 CODE ===
@@ -80,17 +127,32 @@ for i, url in enumerate(article_urls):
 
 # === START OF PART 2: TRANSLATE HEADERS ===
 print("\n--- Starting Part 2: Translating Headers ---")
-valid_spanish_titles = [title for title in spanish_titles if title]
-translator = Translator()
-english_titles = []
-for title in valid_spanish_titles:
+# Re-use translations from a previous run where we have them,
+# and translate the rest one at a time.
+english_by_title = {title: translation_cache.get(title)
+                    for title in spanish_titles}
+to_translate = [title for title, english in english_by_title.items()
+                if english is None]
+translator = None
+for title in to_translate:
     try:
-        translated = translator.translate(title, src='es', dest='en')
-        print(f"ES: {title}")
-        print(f"EN: {translated.text}")
-        english_titles.append(translated.text)
+        if translator is None:
+            # googletrans is slow to import, so only load it when needed.
+            from googletrans import Translator
+            translator = Translator()
+        english = translator.translate(title, src='es', dest='en').text
+        english_by_title[title] = english
+        translation_cache.put(title, english)
     except Exception as e:
         print(f"Error translating '{title}': {e}")
+
+english_titles = []
+for title in spanish_titles:
+    english = english_by_title[title]
+    if english:
+        print(f"ES: {title}")
+        print(f"EN: {english}")
+        english_titles.append(english)
 # === END OF PART 2 ===
 
 
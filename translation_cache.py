@@ -0,0 +1,45 @@
+# A small on-disk cache for translated titles, shared by both scripts.
+#
+# Every run scrapes (mostly) the same headlines, so there's no point paying
+# for a googletrans round trip - and risking its rate limit - each time.
+# Translations are kept in a local `shelve` file and expire after a week.
+
+import atexit
+import hashlib
+import shelve
+import threading
+import time
+
+CACHE_PATH = ".xlate_cache"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # one week
+
+# `shelve` is not thread-safe, so every read/write goes through this lock.
+_DB = shelve.open(CACHE_PATH)
+_DB_LOCK = threading.Lock()
+
+# Make sure everything is flushed to disk when the script exits.
+atexit.register(_DB.close)
+
+
+def _key(text, src, dest):
+    # Hash the title so the key stays short no matter how long the text is.
+    return hashlib.sha256(f"{src}|{dest}|{text}".encode()).hexdigest()
+
+
+def get(text, src='es', dest='en'):
+    """Returns the cached translation of `text`, or None if there isn't one."""
+    with _DB_LOCK:
+        entry = _DB.get(_key(text, src, dest))
+    if entry is None:
+        return None
+
+    translation, saved_at = entry
+    if time.time() - saved_at > CACHE_TTL_SECONDS:
+        return None
+    return translation
+
+
+def put(text, translation, src='es', dest='en'):
+    """Saves the translation of `text` to the cache."""
+    with _DB_LOCK:
+        _DB[_key(text, src, dest)] = (translation, time.time())